@@ -1,6 +1,9 @@
+import fcntl
 import os
 import subprocess
 import sys
+from contextlib import suppress
+from functools import partial
 
 from snakeoil.cli.exceptions import UserException
 
@@ -27,3 +30,36 @@ def run(*args, **kwargs):
         raise UserException(str(exc))
     except subprocess.CalledProcessError as exc:
         raise GitError(exc.returncode)
+
+
+def iter_fields(*args, bufsize=65536, pipesize=1 << 20, **kwargs):
+    """Run git via subprocess.Popen(), lazily yielding NUL-separated output fields.
+
+    Meant for use with commands run with the ``-z`` option, yielding raw bytes
+    fields as output is read from the pipe instead of buffering it all. Where
+    supported, the pipe capacity is raised to ``pipesize`` so git blocks less
+    often on large outputs.
+    """
+    kwargs.setdefault("env", os.environ.copy())["PKGDEV"] = "1"
+    cmd = ["git"] + list(args)
+
+    try:
+        p = subprocess.Popen(cmd, stdout=subprocess.PIPE, **kwargs)
+    except FileNotFoundError as exc:
+        raise UserException(str(exc))
+
+    # enlarging the pipe is optional, e.g. it's refused above fs.pipe-max-size
+    if hasattr(fcntl, "F_SETPIPE_SZ"):
+        with suppress(OSError):
+            fcntl.fcntl(p.stdout, fcntl.F_SETPIPE_SZ, pipesize)
+
+    with p:
+        remainder = b""
+        for chunk in iter(partial(p.stdout.read, bufsize), b""):
+            *fields, remainder = (remainder + chunk).split(b"\x00")
+            yield from fields
+        if remainder:
+            yield remainder
+
+    if p.returncode:
+        raise GitError(p.returncode)
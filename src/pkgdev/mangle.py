@@ -9,7 +9,6 @@ import traceback
 from datetime import datetime
 
 from snakeoil.cli.exceptions import UserException
-from snakeoil.mappings import OrderedSet
 
 copyright_regex = re.compile(
     r"^# Copyright (?P<date>(?P<begin>\d{4}-)?(?P<end>\d{4})) (?P<holder>.+)$"
@@ -43,10 +42,11 @@ class Mangler:
     _mangle_funcs = {}
 
     def __init__(self, changes, skip_regex=None):
-        self.jobs = os.cpu_count()
         if skip_regex is not None:
             changes = (c for c in changes if not skip_regex.match(c.full_path))
-        self.changes = OrderedSet(changes)
+        self.changes = tuple(dict.fromkeys(changes))
+        # don't spawn more worker processes than there are files to mangle
+        self.jobs = max(1, min(os.cpu_count() or 1, len(self.changes)))
 
         # setup for parallelizing the mangling procedure across files
         self._mp_ctx = multiprocessing.get_context("fork")
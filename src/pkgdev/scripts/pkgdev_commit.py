@@ -8,13 +8,11 @@ import subprocess
 import tarfile
 import tempfile
 import textwrap
-from collections import defaultdict, deque, UserDict
+from collections import defaultdict, UserDict
 from dataclasses import dataclass
 from enum import Enum
 from functools import partial
-from itertools import chain
 
-from pkgcheck import reporters, scan
 from pkgcore.ebuild.atom import MalformedAtom
 from pkgcore.ebuild.atom import atom as atom_cls
 from pkgcore.ebuild.repository import UnconfiguredTree, tree
@@ -24,19 +22,79 @@ from pkgcore.restrictions import packages
 from snakeoil.cli import arghparse
 from snakeoil.cli.input import userquery
 from snakeoil.klass import jit_attr
-from snakeoil.mappings import OrderedFrozenSet, OrderedSet
 from snakeoil.osutils import pjoin
 
 from .. import cli, git
 from ..mangle import GentooMangler, Mangler
 from .argparsers import cwd_repo_argparser, git_repo_argparser
 
+# package name and version prefix, used to fast-fail malformed ebuild file names
+_pv_re = re.compile(r"[A-Za-z0-9+_.-]+-[0-9]")
+# sourced bash env variable diffs
+_var_drop_re = re.compile(r"^-declare .+ (?P<name>\w+)=(?P<value>.+)$")
+_var_add_re = re.compile(r"^\+declare .+ (?P<name>\w+)=(?P<value>.+)$")
+_array_re = re.compile(r'\[\d+\]="(?P<val>.+?)"')
+_python_target_re = re.compile(r"^python(\d+)_(\d+)$")
+# commit message body paragraph wrapper
+_body_wrapper = textwrap.TextWrapper(width=85)
+# `pkgcheck scan` args always used when scanning staged changes
+_scan_args = ("--exit", "GentooCI", "--staged")
+
+
+def _ebuild_cpv(path):
+    """Return the CPV string for a repo-relative ebuild path, otherwise None.
+
+    Note that CPV validation is handled on atom instantiation.
+    """
+    if path.endswith(".ebuild"):
+        parts = path.split("/")
+        if len(parts) == 3 and parts[0] and parts[1] and len(parts[2]) > 7:
+            return f"{parts[0]}/{parts[2][:-7]}"
+    return None
+
+
+def _eclass_name(path):
+    """Return the eclass file name for a repo-relative eclass path, otherwise None."""
+    if path.startswith("eclass/") and path.endswith(".eclass"):
+        name = path[7:]
+        if len(name) > 7 and "/" not in name:
+            return name
+    return None
+
+
+def _common_path(common, path):
+    """Return the longest common sub-path of a given common path and path."""
+    while common and not (path == common or path.startswith(common + "/")):
+        common = os.path.dirname(common)
+    return common
+
+
+def _custom_prefix(summary):
+    """Determine if a commit message summary starts with a custom prefix."""
+    # equivalent to matching r"^\S+: " without using the regex engine
+    i = summary.find(": ")
+    return i > 0 and not any(map(str.isspace, summary[:i]))
+
+
+def _filesdir_path(path):
+    """Determine if a repo-relative path is package FILESDIR content."""
+    parts = path.split("/", 3)
+    return len(parts) == 4 and parts[2] == "files" and all(parts)
+
+
+def _versioned_atom(cpv):
+    """Create a versioned atom, fast-failing on obviously malformed versions."""
+    if not _pv_re.match(cpv, cpv.find("/") + 1):
+        raise MalformedAtom(f"={cpv}", "missing version")
+    return atom_cls(f"={cpv}")
+
 
 class ArgumentParser(cli.ArgumentParser):
     """Parse all known arguments, passing unknown arguments to ``git commit``."""
 
     def parse_known_args(self, args=None, namespace=None):
-        namespace.footer = OrderedSet()
+        namespace.footer = []
+        namespace._footer_seen = set()
         namespace.git_add_files = []
         namespace, args = super().parse_known_args(args, namespace)
 
@@ -55,6 +113,14 @@ class ArgumentParser(cli.ArgumentParser):
         return namespace, []
 
 
+def add_footer_tag(namespace, tag, value):
+    """Register a unique tag to inject into the commit message footer."""
+    key = (tag, value)
+    if key not in namespace._footer_seen:
+        namespace._footer_seen.add(key)
+        namespace.footer.append(key)
+
+
 class BugTag(argparse.Action):
     """Register bug-related tag to inject into the commit message footer."""
 
@@ -69,7 +135,7 @@ class BugTag(argparse.Action):
 
     def __call__(self, parser, namespace, value, option_string=None):
         url = self.parse_url(value)
-        namespace.footer.add((self.dest.capitalize(), url))
+        add_footer_tag(namespace, self.dest.capitalize(), url)
 
 
 class CommitTag(argparse.Action):
@@ -82,7 +148,7 @@ class CommitTag(argparse.Action):
                 raise ValueError("empty name or value")
         except ValueError:
             raise argparse.ArgumentError(self, f"invalid commit tag: {value!r}")
-        namespace.footer.add((name.capitalize(), val))
+        add_footer_tag(namespace, name.capitalize(), val)
 
 
 class BugzillaAwareBugTag(BugTag):
@@ -115,7 +181,7 @@ class BugzillaAwareBugTag(BugTag):
         if is_bgo and not res is self.Resolution.FIXED:
             url = f"{url} ({res.value})"
 
-        namespace.footer.add((self.dest.capitalize(), url))
+        add_footer_tag(namespace, self.dest.capitalize(), url)
 
 
 commit = ArgumentParser(
@@ -317,6 +383,9 @@ class HistoricalRepo(UnconfiguredTree):
             error = old_files.stderr.read().decode().strip()
             raise Exception(f"failed populating archive repo: {error}")
         with tarfile.open(mode="r|", fileobj=old_files.stdout) as tar:
+            # explicitly use the data filter when supported by the running python
+            if hasattr(tarfile, "data_filter"):
+                tar.extraction_filter = tarfile.data_filter
             tar.extractall(path=self.location)
 
 
@@ -364,11 +433,23 @@ class ChangeSummary:
         tree_cls = partial(HistoricalRepo, self.repo, tmpdir)
         return tree(self.options.config, repo_config, tree_cls=tree_cls)
 
+    @property
+    def git_email(self):
+        """User email pulled from git config, cached on the options namespace."""
+        if self.options.git_email is None:
+            p = git.run("config", "user.email", stdout=subprocess.PIPE)
+            self.options.git_email = p.stdout.strip()
+        return self.options.git_email
+
+    @jit_attr
+    def statuses(self):
+        """Set of change statuses used to select the summary function."""
+        return frozenset(x.status for x in self.changes.values())
+
     def __str__(self):
         """Serialize git changes into commit summary strings."""
-        statuses = frozenset(x.status for x in self.changes.values())
         try:
-            if s := self.status_funcs[statuses](self):
+            if s := self.status_funcs[self.statuses](self):
                 return s
         except KeyError:  # pragma: no cover
             pass
@@ -400,8 +481,7 @@ class MetadataSummary(ChangeSummary):
         if old_pkg.maintainers != new_pkg.maintainers:
             new = {x.email for x in new_pkg.maintainers}
             old = {x.email for x in old_pkg.maintainers}
-            p = git.run("config", "user.email", stdout=subprocess.PIPE)
-            git_email = p.stdout.strip()
+            git_email = self.git_email
             if git_email in new - old:
                 return "add myself as a maintainer"
             if git_email in old - new:
@@ -469,7 +549,7 @@ class PkgSummary(ChangeSummary):
             # adding a new revbump
             atom = next(iter(self.changes))
             # assume revbump was based on the previous version
-            pkgs = sorted(x for x in self.repo.match(atom.unversioned_atom) if x <= atom)
+            pkgs = sorted(x for x in self.existing if x <= atom)
             try:
                 old_pkg, new_pkg = pkgs[-2:]
             except ValueError:  # pragma: no cover
@@ -507,9 +587,11 @@ class PkgSummary(ChangeSummary):
     def modify(self):
         """Generate summaries for modify actions."""
         summaries = set()
-        for atom in self.changes:
-            pkgs = self.repo.match(atom)
-            self.old_repo.add_pkgs(pkgs)
+        matches = {atom: self.repo.match(atom) for atom in self.changes}
+        # populate historical repo for all modified packages at once
+        if new_pkgs := [pkg for pkgs in matches.values() for pkg in pkgs]:
+            self.old_repo.add_pkgs(new_pkgs)
+        for atom, pkgs in matches.items():
             try:
                 old_pkg = self.old_repo.match(atom)[0]
                 new_pkg = pkgs[0]
@@ -555,14 +637,12 @@ class PkgSummary(ChangeSummary):
                 # use sourced bash env diffs to determine summaries
                 old_env = old_pkg.environment.data.splitlines()
                 new_env = new_pkg.environment.data.splitlines()
-                var_drop_re = re.compile(r"^-declare .+ (?P<name>\w+)=(?P<value>.+)$")
-                var_add_re = re.compile(r"^\+declare .+ (?P<name>\w+)=(?P<value>.+)$")
                 drop, add = {}, {}
 
                 for x in difflib.unified_diff(old_env, new_env):
-                    if mo := var_drop_re.match(x):
+                    if mo := _var_drop_re.match(x):
                         drop[mo.group("name")] = mo.group("value")
-                    elif mo := var_add_re.match(x):
+                    elif mo := _var_add_re.match(x):
                         add[mo.group("name")] = mo.group("value")
 
                 watch_vars = {"HOMEPAGE", "DESCRIPTION", "LICENSE", "SRC_URI"}
@@ -580,15 +660,14 @@ class PkgSummary(ChangeSummary):
                     summaries.add(f"update {', '.join(updated)}")
                 elif (target := targets & updated_vars) and len(target) == 1:
                     target = next(iter(target))
-                    py_re = partial(re.sub, r"^python(\d+)_(\d+)$", r"py\1.\2")
+                    py_re = partial(_python_target_re.sub, r"py\1.\2")
                     use_expand = {
                         py_re(use[len(target) + 2 :])
                         for use, _ in self.repo.use_expand_desc[use_expand_mapping[target]]
                     }
                     if target in array_targets:
-                        array_re = re.compile(r'\[\d+\]="(?P<val>.+?)"')
-                        old = {py_re(m.group("val")) for m in re.finditer(array_re, drop[target])}
-                        new = {py_re(m.group("val")) for m in re.finditer(array_re, add[target])}
+                        old = {py_re(m.group("val")) for m in _array_re.finditer(drop[target])}
+                        new = {py_re(m.group("val")) for m in _array_re.finditer(add[target])}
                     else:
                         old = set(drop[target].strip('"').split())
                         new = set(add[target].strip('"').split())
@@ -611,10 +690,6 @@ class PkgSummary(ChangeSummary):
 class GitChanges(UserDict):
     """Mapping of change objects for staged git changes."""
 
-    # ebuild path regex, validation is handled on instantiation
-    _ebuild_re = re.compile(r"^(?P<category>[^/]+)/[^/]+/(?P<package>[^/]+)\.ebuild$")
-    _eclass_re = re.compile(r"^eclass/(?P<name>[^/]+\.eclass)$")
-
     def __init__(self, options):
         self._options = options
         self._repo = options.repo
@@ -626,77 +701,120 @@ class GitChanges(UserDict):
         if self._options.git_add_arg:
             git.run("add", self._options.git_add_arg, self._options.cwd)
 
-        # determine staged changes forcing rename search
-        p = git.run(
-            "diff-index",
-            "--diff-filter=ARMD",
-            "--find-renames",
-            "--name-status",
-            "--cached",
+        # determine staged and untracked changes forcing rename search
+        fields = git.iter_fields(
+            "status",
+            "--porcelain=v2",
             "-z",
-            "HEAD",
-            *self._options.git_args_paths,
-            stdout=subprocess.PIPE,
+            "--untracked-files=all",
+            "--find-renames",
         )
 
-        # if no changes exist, exit early
-        if not p.stdout:
-            commit.error("no staged changes exist")
+        location = self._repo.location
+        # limit staged changes to targeted paths, relative to the repo root
+        targets = tuple(
+            os.path.relpath(os.path.abspath(x), location) for x in self._options.git_args_paths
+        )
 
-        data = deque(p.stdout.strip("\x00").split("\x00"))
-        changes = defaultdict(OrderedSet)
-        while data:
-            status = data.popleft()
-            old_path = None
-            if status.startswith("R"):
-                status = "R"
-                old_path = data.popleft()
-            path = data.popleft()
-            path_components = path.split(os.sep)
-            if path_components[0] in self._repo.categories and len(path_components) > 2:
-                if mo := self._ebuild_re.match(path):
+        # paths are unique in git status output so no deduplication is required
+        changes = defaultdict(list)
+        common_paths = {}
+        untracked_pkgs = set()
+        categories = frozenset(self._repo.categories)
+        # parse raw records, only decoding paths that are used
+        for record in fields:
+            kind = record[:2]
+            if kind == b"1 ":
+                # ordinary changed entries
+                _, xy, *_, path = record.split(b" ", 8)
+                old_path = None
+            elif kind == b"2 ":
+                # renamed or copied entries
+                _, xy, *_, path = record.split(b" ", 9)
+                old_path = next(fields)
+            elif kind == b"? ":
+                # untracked ebuilds are excluded from manifesting
+                if record.endswith(b".ebuild") and (cpv := _ebuild_cpv(os.fsdecode(record[2:]))):
+                    try:
+                        untracked_pkgs.add(_versioned_atom(cpv))
+                    except MalformedAtom:
+                        pass
+                continue
+            else:
+                # skip unmerged entries
+                continue
+
+            # only handle added, renamed, modified, and deleted index entries
+            status = chr(xy[0])
+            if status not in ("A", "R", "M", "D"):
+                continue
+            path = os.fsdecode(path)
+            if old_path is not None:
+                old_path = os.fsdecode(old_path)
+            if targets and not any(
+                x == "." or path == x or path.startswith(x + "/") for x in targets
+            ):
+                continue
+
+            # determine top-level dir and, for package files, the package dir end
+            i = path.find("/")
+            top = path if i < 0 else path[:i]
+            if top in categories and (j := path.find("/", i + 1)) > 0:
+                key = PkgChange
+                if cpv := _ebuild_cpv(path):
                     # ebuild changes
                     try:
-                        atom = atom_cls(f"={mo.group('category')}/{mo.group('package')}")
+                        atom = _versioned_atom(cpv)
                         old = None
-                        if status == "R" and (om := self._ebuild_re.match(old_path)):
-                            old = atom_cls(f"={om.group('category')}/{om.group('package')}")
-                        changes[PkgChange].add(
-                            PkgChange(
-                                self._repo.location, status, path, atom=atom, ebuild=True, old=old
-                            )
-                        )
+                        if status == "R" and (old_cpv := _ebuild_cpv(old_path)):
+                            old = _versioned_atom(old_cpv)
                     except MalformedAtom:
                         continue
+                    change = PkgChange(location, status, path, atom=atom, ebuild=True, old=old)
                 else:
                     # non-ebuild package level changes
-                    atom = atom_cls(os.sep.join(path_components[:2]))
-                    changes[PkgChange].add(
-                        PkgChange(self._repo.location, status, path, atom=atom, ebuild=False)
-                    )
-            elif mo := self._eclass_re.match(path):
-                changes[EclassChange].add(
-                    EclassChange(self._repo.location, status, path, name=mo.group("name"))
-                )
+                    atom = atom_cls(path[:j])
+                    change = PkgChange(location, status, path, atom=atom, ebuild=False)
+            elif name := _eclass_name(path):
+                key = EclassChange
+                change = EclassChange(location, status, path, name=name)
             else:
-                changes[path_components[0]].add(Change(self._repo.location, status, path))
+                key = top
+                change = Change(location, status, path)
+
+            changes[key].append(change)
+            # track common path for all changes of the same type
+            common_paths[key] = _common_path(common_paths.get(key, path), path)
 
+        # if no changes exist, exit early
+        if not changes:
+            commit.error("no staged changes exist")
+
+        self.untracked_pkgs = frozenset(untracked_pkgs)
+        self._common_paths = common_paths
         return changes
 
     @jit_attr
     def all(self):
-        """Ordered set of all change objects."""
-        return OrderedFrozenSet(chain.from_iterable(self.data.values()))
+        """Tuple of all change objects.
+
+        Change objects are unique within their type buckets and buckets are
+        disjoint so no further deduplication is required.
+        """
+        changes = []
+        for objs in self.data.values():
+            changes.extend(objs)
+        return tuple(changes)
 
     @jit_attr
     def pkg_changes(self):
-        """Ordered set of all package change objects."""
-        return OrderedFrozenSet(self.data.get(PkgChange, ()))
+        """Tuple of all package change objects."""
+        return tuple(self.data.get(PkgChange, ()))
 
     @jit_attr
     def ebuild_changes(self):
-        """Ordered set of all ebuild change objects."""
-        return OrderedFrozenSet(x for x in self.pkg_changes if x.ebuild)
+        """Tuple of all ebuild change objects."""
+        return tuple(x for x in self.pkg_changes if x.ebuild)
 
     @jit_attr
     def prefix(self):
@@ -720,9 +838,9 @@ class GitChanges(UserDict):
                 return change_objs[0].prefix
             else:
                 # multiple changes of the same object type
-                common_path = os.path.commonpath(x.path for x in change_objs)
+                common_path = self._common_paths[change_type]
                 if change_type is PkgChange:
-                    if os.sep in common_path:
+                    if "/" in common_path:
                         return f"{common_path}: "
                     elif common_path:
                         return f"{common_path}/*: "
@@ -736,8 +854,10 @@ class GitChanges(UserDict):
     @jit_attr
     def summary(self):
         """Determine commit message summary."""
-        # all changes made on the same package
-        if len({x.atom.key for x in self.pkg_changes}) == 1:
+        # all changes made on the same package, bailing on the first mismatch
+        if self.pkg_changes and all(
+            x.atom.key == self.pkg_changes[0].atom.key for x in self.pkg_changes[1:]
+        ):
             if not self.ebuild_changes:
                 if len(self.pkg_changes) == 1:
                     if self.pkg_changes[0].path.endswith("/Manifest"):
@@ -786,7 +906,7 @@ class Change:
 
     @property
     def prefix(self):
-        if os.sep in self.path:
+        if "/" in self.path:
             # use change path's parent directory
             return f"{os.path.dirname(self.path)}: "
         # use repo root file name
@@ -817,6 +937,16 @@ class PkgChange(Change):
         return f"{self.atom.key}: "
 
 
+def _message_file(message, *, template=False):
+    """Write a commit message to a tempfile, returning the related `git commit` args."""
+    with tempfile.NamedTemporaryFile(mode="w", delete=False) as tmp:
+        tmp.write(message)
+
+    # remove the closed tempfile on exit once `git commit` is done with it
+    atexit.register(os.unlink, tmp.name)
+    return ["-t" if template else "-F", tmp.name]
+
+
 def determine_msg_args(options, changes):
     """Determine message-related arguments used with `git commit`."""
     args = []
@@ -837,7 +967,7 @@ def determine_msg_args(options, changes):
         # determine commit message
         if message:
             # ignore generated prefix when using custom prefix
-            if not re.match(r"^\S+: ", message[0]):
+            if not _custom_prefix(message[0]):
                 message[0] = changes.prefix + message[0]
         elif changes.prefix:
             # use generated summary if a generated prefix exists
@@ -846,30 +976,20 @@ def determine_msg_args(options, changes):
             # use empty string to force user input
             message.append("")
 
-        tmp = tempfile.NamedTemporaryFile(mode="w")
-        tmp.write(message[0])
+        data = message[0]
         if len(message) > 1:
             # wrap body paragraphs at 85 chars
-            body = ("\n".join(textwrap.wrap(x, width=85)) for x in message[1:])
-            tmp.write("\n\n" + "\n\n".join(body))
+            body = ("\n".join(_body_wrapper.wrap(x)) for x in message[1:])
+            data += "\n\n" + "\n\n".join(body)
 
         # add footer tags
         if options.footer:
-            tmp.write("\n\n")
-            for tag, value in options.footer:
-                tmp.write(f"{tag}: {value}\n")
-
-        tmp.flush()
+            data += "\n\n" + "".join(f"{tag}: {value}\n" for tag, value in options.footer)
 
         # force `git commit` to open an editor for uncompleted summary
-        if not message[0] or message[0].endswith(" "):
-            args.extend(["-t", tmp.name])
-        else:
-            args.extend(["-F", tmp.name])
-
-        # Explicitly register tempfile removal so the object isn't garbage
-        # collected and removed when leaving function scope.
-        atexit.register(tmp.close)
+        template = not message[0] or message[0].endswith(" ")
+        # leave stdin alone for git, e.g. for `--patch` prompts and hooks
+        args.extend(_message_file(data, template=template))
 
     return args
 
@@ -883,11 +1003,14 @@ def _commit_validate(parser, namespace):
     if namespace.mangle is None and namespace.gentoo_repo:
         namespace.mangle = True
 
+    # git user email, lazily pulled from git config when required
+    namespace.git_email = None
+
     # determine `pkgcheck scan` args
     namespace.scan_args = ["-v"] * namespace.verbosity
     if namespace.pkgcheck_scan:
         namespace.scan_args.extend(shlex.split(namespace.pkgcheck_scan))
-    namespace.scan_args.extend(["--exit", "GentooCI", "--staged"])
+    namespace.scan_args.extend(_scan_args)
 
     if namespace.gpg_sign is False:
         namespace.commit_args.append("--no-gpg-sign")
@@ -898,28 +1021,12 @@ def _commit_validate(parser, namespace):
 def update_manifests(options, out, err, changes):
     """Update package manifests for any staged ebuild changes."""
     repo = options.repo
-    untracked_ebuild_re = re.compile(r"^\?\? (?P<category>[^/]+)/[^/]+/(?P<package>[^/]+)\.ebuild$")
 
     # update manifests for existing packages
     if atoms := {x.atom.unversioned_atom for x in changes.ebuild_changes}:
-        if pkgs := {x.versioned_atom for x in repo.itermatch(packages.OrRestriction(*atoms))}:
-            # pull all matches and drop untracked ebuilds
-            p = git.run(
-                "status",
-                "--porcelain=v1",
-                "-u",
-                "-z",
-                "*.ebuild",
-                cwd=repo.location,
-                stdout=subprocess.PIPE,
-            )
-            for path in p.stdout.strip("\x00").split("\x00"):
-                if mo := untracked_ebuild_re.match(path):
-                    try:
-                        untracked = atom_cls(f"={mo.group('category')}/{mo.group('package')}")
-                        pkgs.discard(untracked)
-                    except MalformedAtom:
-                        continue
+        if pkgs := {x.versioned_atom for atom in atoms for x in repo.match(atom)}:
+            # drop untracked ebuilds
+            pkgs.difference_update(changes.untracked_pkgs)
 
             # manifest all staged or committed packages
             failed = repo.operations.manifest(
@@ -932,7 +1039,9 @@ def update_manifests(options, out, err, changes):
                 return 1
 
             # include existing Manifest files for staging
-            manifests = (pjoin(repo.location, f"{x.key}/Manifest") for x in pkgs)
+            keys = dict.fromkeys(x.key for x in pkgs)
+            prefix = repo.location + os.sep
+            manifests = (f"{prefix}{x}/Manifest" for x in keys)
             options.git_add_files.extend(filter(os.path.exists, manifests))
 
     return 0
@@ -951,18 +1060,31 @@ def _commit(options, out, err):
 
     # mangle files
     if options.mangle:
-        # don't mangle FILESDIR content
-        skip_regex = re.compile(rf"^{repo.location}/[^/]+/[^/]+/files/.+$")
-        mangler = GentooMangler if options.gentoo_repo else Mangler
-        files = mangler(changes.all, skip_regex=skip_regex)
-        options.git_add_files.extend(files)
-
-    # stage modified files
+        # don't mangle removed files or FILESDIR content
+        mangle_changes = [x for x in changes.all if x.status != "D" and not _filesdir_path(x.path)]
+        # skip spawning the mangling processes if no files need mangling
+        if mangle_changes:
+            mangler = GentooMangler if options.gentoo_repo else Mangler
+            options.git_add_files.extend(mangler(mangle_changes))
+
+    # stage all modified files at once, dropping duplicates and passing the
+    # paths via stdin to avoid command line length limits
     if options.git_add_files:
-        git.run("add", *options.git_add_files, cwd=repo.location)
+        paths = dict.fromkeys(map(os.fsencode, options.git_add_files))
+        git.run(
+            "add",
+            "--pathspec-from-file=-",
+            "--pathspec-file-nul",
+            cwd=repo.location,
+            input=b"\x00".join(paths),
+            text=False,
+        )
 
     # scan staged changes for QA issues if requested
     if options.scan:
+        # pkgcheck is heavy to import, only load it when scanning
+        from pkgcheck import reporters, scan
+
         pipe = scan(options.scan_args)
         with reporters.FancyReporter(out) as reporter:
             for result in pipe:
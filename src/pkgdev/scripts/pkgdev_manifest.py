@@ -1,6 +1,5 @@
 import os
 import re
-import subprocess
 
 from pkgcore.operations import observer as observer_mod
 from pkgcore.restrictions import packages, values
@@ -10,6 +9,9 @@ from snakeoil.cli import arghparse
 from .. import cli, git
 from .argparsers import cwd_repo_argparser
 
+# porcelain v1 status record for a modified or untracked ebuild
+_ebuild_status_re = re.compile(rb"^[ MTARC?]{2} (?P<path>[^/]+/[^/]+/[^/]+\.ebuild)$")
+
 manifest = cli.ArgumentParser(
     prog="pkgdev manifest", description="update package manifests", parents=(cwd_repo_argparser,)
 )
@@ -98,15 +100,13 @@ def _restrict_targets(repo, targets):
 
 
 def _restrict_modified_files(repo):
-    ebuild_re = re.compile(r"^[ MTARC?]{2} (?P<path>[^/]+/[^/]+/[^/]+\.ebuild)$")
-    p = git.run(
-        "status", "--porcelain=v1", "-z", "*.ebuild", cwd=repo.location, stdout=subprocess.PIPE
-    )
+    fields = git.iter_fields("status", "--porcelain=v1", "-z", "*.ebuild", cwd=repo.location)
 
     restrictions = []
-    for line in p.stdout.strip("\x00").split("\x00"):
-        if mo := ebuild_re.match(line):
-            restrictions.append(repo.path_restrict(mo.group("path")))
+    for line in fields:
+        # only decode the paths of matching records
+        if mo := _ebuild_status_re.match(line):
+            restrictions.append(repo.path_restrict(os.fsdecode(mo.group("path"))))
     return packages.OrRestriction(*restrictions)
 
 
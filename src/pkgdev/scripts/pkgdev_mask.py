@@ -9,8 +9,6 @@ import urllib.request as urllib
 from collections import deque
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from itertools import groupby
-from operator import itemgetter
 from typing import List
 
 from pkgcore.ebuild.atom import MalformedAtom
@@ -24,6 +22,13 @@ from snakeoil.strings import pluralism
 from .. import git
 from .argparsers import cwd_repo_argparser, git_repo_argparser, BugzillaApiKey
 
+# mask entry attribution line, e.g. "Larry the Cow <larry@gentoo.org> (2022-09-09)"
+_attribution_re = re.compile(r"^(?P<author>.+) <(?P<email>.+)> \((?P<date>\d{4}-\d{2}-\d{2})\)$")
+_removal_re = re.compile(r"^Removal: (?P<date>\d{4}-\d{2}-\d{2})")
+
+# headers used for Bugzilla REST API requests
+_bugzilla_headers = {"Content-Type": "application/json", "Accept": "application/json"}
+
 mask = arghparse.ArgumentParser(
     prog="pkgdev mask",
     description="mask packages",
@@ -102,7 +107,7 @@ def _mask_validate(parser, namespace):
     maintainers = set()
 
     try:
-        namespace.bugs = list(map(int, dict.fromkeys(namespace.bugs)))
+        namespace.bugs = list(dict.fromkeys(map(int, namespace.bugs)))
     except ValueError:
         parser.error("argument -b/--bug: invalid integer value")
     if min(namespace.bugs, default=1) < 1:
@@ -118,7 +123,7 @@ def _mask_validate(parser, namespace):
 
     if namespace.targets:
         for x in namespace.targets:
-            if os.path.exists(x) and x.endswith(".ebuild"):
+            if x.endswith(".ebuild") and os.path.exists(x):
                 restrict = namespace.repo.path_restrict(x)
                 pkg = next(namespace.repo.itermatch(restrict))
                 atom = pkg.versioned_atom
@@ -128,11 +133,12 @@ def _mask_validate(parser, namespace):
                     atom = atom_cls(x)
                 except MalformedAtom:
                     mask.error(f"invalid atom: {x!r}")
-                if pkgs := namespace.repo.match(atom):
-                    maintainers.update(
-                        maintainer.email for pkg in pkgs for maintainer in pkg.maintainers
-                    )
-                else:
+                # stream matches, avoiding sorting and holding all matched pkgs
+                matched = False
+                for pkg in namespace.repo.itermatch(atom):
+                    maintainers.update(maintainer.email for maintainer in pkg.maintainers)
+                    matched = True
+                if not matched:
                     mask.error(f"no repo matches: {x!r}")
             atoms.add(atom)
     else:
@@ -158,8 +164,6 @@ class Mask:
     comment: List[str]
     atoms: List[atom_cls]
 
-    _removal_re = re.compile(r"^Removal: (?P<date>\d{4}-\d{2}-\d{2})")
-
     def __str__(self):
         lines = [f"# {self.author} <{self.email}> ({self.date})"]
         lines.extend(f"# {x}" if x else "#" for x in self.comment)
@@ -169,22 +173,26 @@ class Mask:
     @property
     def removal(self):
         """Pull removal date from comment."""
-        if mo := self._removal_re.match(self.comment[-1]):
+        if mo := _removal_re.match(self.comment[-1]):
             return mo.group("date")
         return None
 
 
-def consecutive_groups(iterable, ordering=lambda x: x):
-    """Return an iterable split into separate, consecutive groups."""
-    for k, g in groupby(enumerate(iterable), key=lambda x: x[0] - ordering(x[1])):
-        yield map(itemgetter(1), g)
+def consecutive_groups(iterable):
+    """Split an ascending iterable of integers into lists of consecutive values."""
+    group = []
+    for x in iterable:
+        if group and x != group[-1] + 1:
+            yield group
+            group = []
+        group.append(x)
+    if group:
+        yield group
 
 
 class MaskFile:
     """Object representing the contents of a package.mask file."""
 
-    attribution_re = re.compile(r"^(?P<author>.+) <(?P<email>.+)> \((?P<date>\d{4}-\d{2}-\d{2})\)$")
-
     def __init__(self, path):
         self.path = path
         self.profile = ProfileNode(os.path.dirname(path))
@@ -201,30 +209,32 @@ class MaskFile:
         """Parse the given file into Mask objects."""
         with open(self.path) as f:
             lines = f.readlines()
-
-        # determine mask groups by line number
-        mask_map = dict(iter_read_bash(self.path, enum_line=True))
-        for mask_lines in map(list, consecutive_groups(mask_map)):
-            # use profile's EAPI setting to coerce supported masks
-            atoms = [self.profile.eapi_atom(mask_map[x]) for x in mask_lines]
-
-            # pull comment lines above initial mask entry line
-            comment = []
-            i = mask_lines[0] - 2
-            while i >= 0 and (line := lines[i].rstrip()):
-                if not line.startswith("# ") and line != "#":
-                    mask.error(f"invalid mask entry header, lineno {i + 1}: {line!r}")
-                comment.append(line[2:])
-                i -= 1
-            if not self.header:
-                self.header = lines[: i + 1]
-            comment = list(reversed(comment))
+        stripped = [x.rstrip() for x in lines]
+
+        # determine mask groups by line number, reusing the lines already read
+        mask_map = dict(iter_read_bash(lines, enum_line=True))
+        # use profile's EAPI setting to coerce supported masks
+        eapi_atom = self.profile.eapi_atom
+        for mask_lines in consecutive_groups(mask_map):
+            atoms = [eapi_atom(mask_map[x]) for x in mask_lines]
+
+            # pull the block of comment lines above initial mask entry line
+            start = end = mask_lines[0] - 1
+            while start > 0 and stripped[start - 1]:
+                start -= 1
+            for i in reversed(range(start, end)):
+                if not stripped[i].startswith("# ") and stripped[i] != "#":
+                    mask.error(f"invalid mask entry header, lineno {i + 1}: {stripped[i]!r}")
+            comment = [x[2:] for x in stripped[start:end]]
+            # only content preceding the first mask entry is header
+            if not self.masks:
+                self.header = lines[:start]
 
             # pull attribution data from first comment line
-            if mo := self.attribution_re.match(comment[0]):
+            if mo := _attribution_re.match(comment[0]):
                 author, email, date = mo.group("author"), mo.group("email"), mo.group("date")
             else:
-                mask.error(f"invalid author, lineno {i + 2}: {comment[0]!r}")
+                mask.error(f"invalid author, lineno {start + 1}: {comment[0]!r}")
 
             self.masks.append(Mask(author, email, date, comment[1:], atoms))
 
@@ -273,12 +283,10 @@ def get_comment():
         mask.error(f"nonexistent editor: {editor[0]!r}")
 
     with open(tmp.name) as f:
-        # strip trailing whitespace from lines
-        comment = (x.rstrip() for x in f.readlines())
-    # strip comments
-    comment = (x for x in comment if not x.startswith("#"))
-    # strip leading/trailing newlines
-    comment = "\n".join(comment).strip().splitlines()
+        # strip comments and trailing whitespace from lines
+        comment = (x.rstrip() for x in f if not x.startswith("#"))
+        # strip leading/trailing newlines
+        comment = "\n".join(comment).strip().splitlines()
     if not comment:
         mask.error("empty mask comment")
     return comment
@@ -287,7 +295,8 @@ def get_comment():
 def message_removal_notice(bugs: list[int], rites: int):
     summary = []
     if rites:
-        summary.append(f"Removal on {datetime.now(timezone.utc) + timedelta(days=rites):%Y-%m-%d}.")
+        removal = datetime.now(timezone.utc) + timedelta(days=rites)
+        summary.append(f"Removal on {removal.date().isoformat()}.")
     if bugs:
         # Bug(s) #A, #B, #C
         bug_list = ", ".join(f"#{b}" for b in bugs)
@@ -310,17 +319,14 @@ def file_last_rites_bug(options, message: str) -> int:
         keywords=["PMASKED"],
         assigned_to=options.maintainers[0],
         cc=options.maintainers[1:] + ["treecleaner@gentoo.org"],
-        deadline=(datetime.now(timezone.utc) + timedelta(days=options.rites)).strftime("%Y-%m-%d"),
+        deadline=(datetime.now(timezone.utc) + timedelta(days=options.rites)).date().isoformat(),
         blocks=list(options.bugs),
     )
     request = urllib.Request(
         url="https://bugs.gentoo.org/rest/bug",
-        data=json.dumps(request_data).encode("utf-8"),
+        data=json.dumps(request_data, separators=(",", ":")).encode("utf-8"),
         method="POST",
-        headers={
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-        },
+        headers=_bugzilla_headers,
     )
     with urllib.urlopen(request, timeout=30) as response:
         reply = json.loads(response.read().decode("utf-8"))
@@ -337,12 +343,9 @@ def update_bugs_pmasked(api_key: str, bugs: list[int]):
     )
     request = urllib.Request(
         url=f"https://bugs.gentoo.org/rest/bug/{bugs[0]}",
-        data=json.dumps(request_data).encode("utf-8"),
+        data=json.dumps(request_data, separators=(",", ":")).encode("utf-8"),
         method="PUT",
-        headers={
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-        },
+        headers=_bugzilla_headers,
     )
     with urllib.urlopen(request, timeout=30) as response:
         return response.status == 200
@@ -374,11 +377,19 @@ def _mask(options, out, err):
     mask_file = MaskFile(pjoin(options.repo.location, "profiles/package.mask"))
     today = datetime.now(timezone.utc)
 
-    # pull name/email from git config
-    p = git.run("config", "user.name", stdout=subprocess.PIPE)
-    author = p.stdout.strip()
-    p = git.run("config", "user.email", stdout=subprocess.PIPE)
-    email = p.stdout.strip()
+    # pull name/email from git config via a single call, exiting with status 1
+    # if neither is set
+    p = git.run(
+        "config", "--get-regexp", r"^user\.(name|email)$", stdout=subprocess.PIPE, check=False
+    )
+    if p.returncode not in (0, 1):
+        raise git.GitError(p.returncode)
+    config = dict(x.partition(" ")[::2] for x in p.stdout.splitlines())
+    try:
+        author = config["user.name"].strip()
+        email = config["user.email"].strip()
+    except KeyError as exc:
+        mask.error(f"unset git config option: {exc.args[0]}")
 
     message = get_comment()
     if options.file_bug:
@@ -395,7 +406,7 @@ def _mask(options, out, err):
     m = Mask(
         author=author,
         email=email,
-        date=today.strftime("%Y-%m-%d"),
+        date=today.date().isoformat(),
         comment=message,
         atoms=options.atoms,
     )
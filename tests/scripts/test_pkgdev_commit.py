@@ -1,5 +1,6 @@
 import os
 import shutil
+import subprocess
 import textwrap
 from datetime import datetime
 from functools import partial
@@ -135,22 +136,22 @@ class TestPkgdevCommitParseArgs:
             # bug IDs
             for opt in ("-b", "--bug"):
                 options, _ = tool.parse_args(["commit", opt, "1"])
-                assert options.footer == {("Bug", "https://bugs.gentoo.org/1")}
+                assert options.footer == [("Bug", "https://bugs.gentoo.org/1")]
 
             # bug URLs
             for opt in ("-b", "--bug"):
                 options, _ = tool.parse_args(["commit", opt, "https://bugs.gentoo.org/2"])
-                assert options.footer == {("Bug", "https://bugs.gentoo.org/2")}
+                assert options.footer == [("Bug", "https://bugs.gentoo.org/2")]
 
             # bug IDs
             for opt in ("-c", "--closes"):
                 options, _ = tool.parse_args(["commit", opt, "1"])
-                assert options.footer == {("Closes", "https://bugs.gentoo.org/1")}
+                assert options.footer == [("Closes", "https://bugs.gentoo.org/1")]
 
             # bug URLs
             for opt in ("-c", "--closes"):
                 options, _ = tool.parse_args(["commit", opt, "https://bugs.gentoo.org/2"])
-                assert options.footer == {("Closes", "https://bugs.gentoo.org/2")}
+                assert options.footer == [("Closes", "https://bugs.gentoo.org/2")]
 
             # bug IDs and URLs with good resolutions
             for opt in ("-c", "--closes"):
@@ -162,9 +163,9 @@ class TestPkgdevCommitParseArgs:
                     for value in values:
                         for bug in "1", "https://bugs.gentoo.org/1":
                             options, _ = tool.parse_args(["commit", opt, f"{bug}:{value}"])
-                            assert options.footer == {
+                            assert options.footer == [
                                 ("Closes", f"https://bugs.gentoo.org/1{expected}")
-                            }
+                            ]
 
             # bad bug-resolution pair
             for opt in ("-c", "--closes"):
@@ -199,7 +200,14 @@ class TestPkgdevCommitParseArgs:
                     ("tag:multiple:values", ("Tag", "multiple:values")),
                 ):
                     options, _ = tool.parse_args(["commit", opt, value])
-                    assert options.footer == {expected}
+                    assert options.footer == [expected]
+
+            # duplicate tags are only registered once, preserving order
+            options, _ = tool.parse_args(["commit", "-b", "2", "-b", "1", "-b", "2"])
+            assert options.footer == [
+                ("Bug", "https://bugs.gentoo.org/2"),
+                ("Bug", "https://bugs.gentoo.org/1"),
+            ]
 
             # bad tags
             for opt in ("-T", "--tag"):
@@ -1196,3 +1204,81 @@ class TestPkgdevCommit:
         out, err = capsys.readouterr()
         assert not err
         assert out == " * cat/pkg-1: invalid EAPI '-1'\n"
+
+    def test_target_paths(self, capsys, repo, make_git_repo):
+        git_repo = make_git_repo(repo.location)
+        repo.create_ebuild("cat/pkg-0")
+        git_repo.add_all("cat/pkg-0")
+        repo.create_ebuild("cat/pkg-1")
+        repo.create_ebuild("cat/newpkg-0")
+        git_repo.add_all("cat/pkg-1 cat/newpkg-0", commit=False)
+
+        # only changes matching the target path are committed
+        with (
+            patch("sys.argv", self.args + ["-m", "msg", "cat/pkg"]),
+            pytest.raises(SystemExit) as excinfo,
+            chdir(git_repo.path),
+        ):
+            self.script()
+        assert excinfo.value.code == 0
+        out, err = capsys.readouterr()
+        assert not err
+        commit_msg = git_repo.log(["-1", "--pretty=tformat:%B", "HEAD"])
+        assert commit_msg == ["cat/pkg: msg"]
+        files = git_repo.log(["-1", "--name-only", "--pretty=tformat:", "HEAD"])
+        assert files == ["cat/pkg/pkg-1.ebuild"]
+
+        # other staged changes are left alone
+        p = git_repo.run(["git", "diff", "--cached", "--name-only"], stdout=subprocess.PIPE)
+        assert p.stdout.splitlines() == ["cat/newpkg/newpkg-0.ebuild"]
+
+    def test_target_cwd(self, capsys, repo, make_git_repo):
+        git_repo = make_git_repo(repo.location)
+        repo.create_ebuild("cat/pkg-0")
+        git_repo.add_all("cat/pkg-0")
+        repo.create_ebuild("cat/pkg-1")
+        repo.create_ebuild("cat/newpkg-0")
+        git_repo.add_all("cat/pkg-1 cat/newpkg-0", commit=False)
+
+        # "." targets the package dir the command is run from
+        with (
+            patch("sys.argv", self.args + ["-m", "msg", "."]),
+            pytest.raises(SystemExit) as excinfo,
+            chdir(pjoin(git_repo.path, "cat/pkg")),
+        ):
+            self.script()
+        assert excinfo.value.code == 0
+        out, err = capsys.readouterr()
+        assert not err
+        commit_msg = git_repo.log(["-1", "--pretty=tformat:%B", "HEAD"])
+        assert commit_msg == ["cat/pkg: msg"]
+        files = git_repo.log(["-1", "--name-only", "--pretty=tformat:", "HEAD"])
+        assert files == ["cat/pkg/pkg-1.ebuild"]
+
+    def test_untracked_ebuild(self, capsys, repo, make_git_repo, tmp_path):
+        git_repo = make_git_repo(repo.location)
+        repo.create_ebuild("cat/pkg-0")
+        git_repo.add_all("cat/pkg-0")
+        repo.create_ebuild("cat/pkg-1")
+        git_repo.add("cat/pkg/pkg-1.ebuild", commit=False)
+        # untracked ebuild distfiles would be manifested if they weren't skipped
+        repo.create_ebuild("cat/pkg-2", src_uri="https://pkgdev.test/pkg-2.tar.gz")
+        distdir = tmp_path / "distfiles"
+        distdir.mkdir()
+        (distdir / "pkg-2.tar.gz").write_text("data")
+
+        with (
+            patch("sys.argv", self.args + ["--distdir", str(distdir), "-m", "msg"]),
+            pytest.raises(SystemExit) as excinfo,
+            chdir(git_repo.path),
+        ):
+            self.script()
+        assert excinfo.value.code == 0
+        out, err = capsys.readouterr()
+        assert not err
+        assert not os.path.exists(pjoin(git_repo.path, "cat/pkg/Manifest"))
+        commit_msg = git_repo.log(["-1", "--pretty=tformat:%B", "HEAD"])
+        assert commit_msg == ["cat/pkg: msg"]
+        files = git_repo.log(["-1", "--name-only", "--pretty=tformat:", "HEAD"])
+        assert files == ["cat/pkg/pkg-1.ebuild"]
+        assert git_repo.changes == ["cat/pkg/pkg-2.ebuild"]
@@ -164,6 +164,22 @@ class TestPkgdevMask:
         out, err = capsys.readouterr()
         assert err.strip() == "pkgdev mask: error: empty mask comment"
 
+    def test_unset_git_config(self, capsys):
+        # ignore user and system level git config
+        git_env = {"GIT_CONFIG_GLOBAL": os.devnull, "GIT_CONFIG_NOSYSTEM": "1"}
+        # unset user.email, then user.name as well which is reported first
+        for option in ("user.email", "user.name"):
+            self.git_repo.run(["git", "config", "--unset", option])
+            with (
+                os_environ(**git_env),
+                patch("sys.argv", self.args + ["cat/pkg"]),
+                pytest.raises(SystemExit),
+                chdir(pjoin(self.repo.path)),
+            ):
+                self.script()
+            _, err = capsys.readouterr()
+            assert err.strip() == f"pkgdev mask: error: unset git config option: {option}"
+
     def test_mask_cwd(self):
         with (
             os_environ("VISUAL", EDITOR="sed -i '1s/$/mask comment/'"),
@@ -214,6 +230,39 @@ class TestPkgdevMask:
             self.script()
         assert self.profile.masks == frozenset([atom_cls("cat/masked"), atom_cls("=cat/pkg-0")])
 
+    def test_existing_masks_without_header(self):
+        masks = textwrap.dedent(
+            """\
+                # Random Dev <random.dev@email.com> (2021-03-24)
+                # masked
+                cat/masked
+
+                # Random Dev <random.dev@email.com> (2021-03-24)
+                # masked2
+                cat/masked2
+            """
+        )
+        self.masks_path.write_text(masks)
+
+        with (
+            os_environ("VISUAL", EDITOR="sed -i '1s/$/mask comment/'"),
+            patch("sys.argv", self.args + ["=cat/pkg-0"]),
+            pytest.raises(SystemExit),
+            chdir(pjoin(self.repo.path)),
+        ):
+            self.script()
+        today = self.today.strftime("%Y-%m-%d")
+        new_mask = textwrap.dedent(
+            f"""\
+                # First Last <first.last@email.com> ({today})
+                # mask comment
+                =cat/pkg-0
+
+            """
+        )
+        # existing entries aren't duplicated as header content
+        assert self.masks_path.read_text() == new_mask + masks
+
     def test_invalid_header(self, capsys):
         self.masks_path.write_text(
             textwrap.dedent(
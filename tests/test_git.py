@@ -24,3 +24,22 @@ class TestGitRun:
         with chdir(git_repo.path):
             p = git.run("rev-parse", "--abbrev-ref", "HEAD", stdout=subprocess.PIPE)
         assert p.stdout.strip() == "main"
+
+
+class TestGitIterFields:
+    def test_git_missing(self):
+        with patch("subprocess.Popen") as git_popen:
+            git_popen.side_effect = FileNotFoundError("no such file 'git'")
+            with pytest.raises(UserException, match="no such file 'git'"):
+                list(git.iter_fields("status", "-z"))
+
+    def test_failed_run(self, git_repo):
+        with chdir(git_repo.path), pytest.raises(git.GitError):
+            list(git.iter_fields("rev-parse", "nonexistent", stderr=subprocess.DEVNULL))
+
+    def test_successful_run(self, git_repo):
+        git_repo.add("a", create=True, commit=False)
+        git_repo.add("b", create=True, commit=False)
+        with chdir(git_repo.path):
+            fields = list(git.iter_fields("ls-files", "-z", "a", "b", bufsize=1))
+        assert fields == [b"a", b"b"]